@@ -123,7 +123,9 @@ class StatsAccumulator:
 
     def add(self, key: str, value: np.ndarray) -> None:
         """Add a value to the accumulator."""
-        flat = value.flatten().astype(np.float64)
+        # ascontiguousarray + ravel does the dtype conversion in one copy
+        # (flatten + astype made two) and is free for contiguous float64
+        flat = np.ascontiguousarray(value, dtype=np.float64).ravel()
 
         if key not in self._count:
             self._count[key] = 0
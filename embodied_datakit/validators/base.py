@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import itertools
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Iterable, Protocol, runtime_checkable
 
 from embodied_datakit.schema.episode import Episode
 from embodied_datakit.schema.spec import DatasetSpec
@@ -96,6 +97,27 @@ class BaseValidator(ABC):
         """Validate an episode."""
         pass
 
+    def validate_episodes(
+        self, episodes: Iterable[Episode], spec: DatasetSpec
+    ) -> list[Finding]:
+        """Validate a batch of episodes.
+
+        Subclasses may override to hoist per-batch setup or vectorize
+        across episodes; the default chains per-episode results.
+
+        Args:
+            episodes: Episodes to validate.
+            spec: Dataset specification.
+
+        Returns:
+            Concatenated findings across the batch.
+        """
+        return list(
+            itertools.chain.from_iterable(
+                self.validate_episode(episode, spec) for episode in episodes
+            )
+        )
+
     def __repr__(self) -> str:
         """String representation."""
         return f"{self.__class__.__name__}()"
@@ -88,7 +88,46 @@ class EpisodesTableWriter:
         
         self._records.append(record)
         return record
-    
+
+    def add_episodes(
+        self,
+        episodes: list[Episode],
+        spec: DatasetSpec,
+        parquet_files: list[str],
+        parquet_row_starts: list[int],
+        parquet_row_ends: list[int],
+    ) -> list[EpisodeIndexRecord]:
+        """Add a batch of episodes in one call.
+
+        Args:
+            episodes: Episodes to add.
+            spec: Dataset specification (shared by the batch).
+            parquet_files: Parquet shard path per episode.
+            parquet_row_starts: Starting row per episode.
+            parquet_row_ends: Ending row per episode.
+
+        Returns:
+            Created EpisodeIndexRecords, in input order.
+        """
+        if not (
+            len(episodes) == len(parquet_files)
+            == len(parquet_row_starts) == len(parquet_row_ends)
+        ):
+            raise ValueError("Batch inputs must have equal lengths")
+
+        return [
+            self.add_episode(
+                episode=episode,
+                spec=spec,
+                parquet_file=parquet_file,
+                parquet_row_start=row_start,
+                parquet_row_end=row_end,
+            )
+            for episode, parquet_file, row_start, row_end in zip(
+                episodes, parquet_files, parquet_row_starts, parquet_row_ends
+            )
+        ]
+
     def write(self) -> Path:
         """Write all records to Parquet file.
         
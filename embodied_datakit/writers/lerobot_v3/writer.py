@@ -35,16 +35,25 @@ class LeRobotV3Writer(BaseWriter):
         self,
         episodes_per_chunk: int = 1000,
         rows_per_parquet: int = 10000,
+        parquet_kwargs: dict[str, Any] | None = None,
+        compute_stats: bool = True,
     ) -> None:
         """Initialize LeRobot v3 writer.
 
         Args:
             episodes_per_chunk: Episodes per chunk directory.
             rows_per_parquet: Target rows per parquet file.
+            parquet_kwargs: Extra keyword arguments forwarded to
+                pyarrow.parquet.write_table (e.g. use_dictionary,
+                compression, row_group_size).
+            compute_stats: When False, skip the mean/std/min/max pass
+                over actions and states and write an empty stats.json.
         """
         super().__init__()
         self.episodes_per_chunk = episodes_per_chunk
         self.rows_per_parquet = rows_per_parquet
+        self.parquet_kwargs = parquet_kwargs or {}
+        self.compute_stats = compute_stats
 
         self._stats = StatsAccumulator()
         self._tasks: dict[str, int] = {}
@@ -99,7 +108,8 @@ class LeRobotV3Writer(BaseWriter):
             self._total_steps += 1
 
             # Update stats
-            self._update_stats(step)
+            if self.compute_stats:
+                self._update_stats(step)
 
         # Flush if buffer is large enough
         if len(self._step_buffer) >= self.rows_per_parquet:
@@ -194,7 +204,7 @@ class LeRobotV3Writer(BaseWriter):
 
         # Convert to table
         table = pa.Table.from_pylist(self._step_buffer)
-        pq.write_table(table, parquet_path)
+        pq.write_table(table, parquet_path, **self.parquet_kwargs)
 
         self._artifacts.append(parquet_path)
         self._step_buffer = []
@@ -231,8 +241,10 @@ class LeRobotV3Writer(BaseWriter):
     def _write_stats_json(self) -> None:
         """Write meta/stats.json."""
         stats_path = self.output_dir / "meta" / "stats.json"
-        dataset_stats = self._stats.compute()
-        stats_dict = dataset_stats.to_dict()
+        if self.compute_stats:
+            stats_dict = self._stats.compute().to_dict()
+        else:
+            stats_dict = {}  # Stats disabled; keep the layout complete
         with open(stats_path, "w") as f:
             json.dump(stats_dict, f, indent=2)
         self._artifacts.append(stats_path)
@@ -244,7 +256,7 @@ class LeRobotV3Writer(BaseWriter):
 
         episodes_path = self.output_dir / "meta" / "episodes" / "episodes.parquet"
         table = pa.Table.from_pylist(self._episode_records)
-        pq.write_table(table, episodes_path)
+        pq.write_table(table, episodes_path, **self.parquet_kwargs)
         self._artifacts.append(episodes_path)
 
     def _get_feature_info(self) -> dict[str, Any]:
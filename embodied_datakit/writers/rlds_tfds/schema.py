@@ -6,6 +6,12 @@ from typing import Any
 
 from embodied_datakit.schema.spec import DatasetSpec, FeatureSpec
 
+# Float features with at least this many elements are serialized as raw
+# little-endian bytes by the TFRecord writer; readers recover them with
+# tf.io.decode_raw and the declared shape. Short vectors stay as
+# FloatList for readability.
+RAW_FLOAT_MIN_ELEMENTS = 16
+
 # TFDS dtype mapping
 DTYPE_MAP = {
     "float32": "float32",
@@ -89,6 +95,23 @@ def build_rlds_schema(spec: DatasetSpec) -> dict[str, Any]:
 def _feature_spec_to_tfds(feat_spec: FeatureSpec) -> dict[str, Any]:
     """Convert FeatureSpec to TFDS feature dict."""
     dtype = DTYPE_MAP.get(feat_spec.dtype, feat_spec.dtype)
+
+    # Long float vectors are written as raw packed bytes (see
+    # RAW_FLOAT_MIN_ELEMENTS); declare them as bytes with the original
+    # dtype kept for tf.io.decode_raw on the reader side.
+    num_elements = 1
+    for dim in feat_spec.shape:
+        num_elements *= dim
+    if dtype in ("float32", "float64") and num_elements >= RAW_FLOAT_MIN_ELEMENTS:
+        # The writer packs float32 regardless of the source dtype — the
+        # same precision FloatList already had for these fields.
+        return {
+            "dtype": "bytes",
+            "raw_dtype": "float32",
+            "shape": feat_spec.shape,
+            "description": feat_spec.description,
+        }
+
     return {
         "dtype": dtype,
         "shape": feat_spec.shape,
@@ -3,14 +3,22 @@
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Iterator
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 import numpy as np
 
 from embodied_datakit.schema.episode import Episode
 from embodied_datakit.schema.spec import DatasetSpec
-from embodied_datakit.writers.rlds_tfds.schema import build_rlds_schema
+
+if TYPE_CHECKING:
+    from embodied_datakit.schema.step import Step
+from embodied_datakit.writers.rlds_tfds.schema import (
+    RAW_FLOAT_MIN_ELEMENTS,
+    build_rlds_schema,
+)
 
 # TensorFlow is optional
 try:
@@ -28,26 +36,42 @@ class TFRecordShardWriter:
         output_dir: Path | str,
         episodes_per_shard: int = 100,
         split: str = "train",
+        spec: DatasetSpec | None = None,
     ) -> None:
         """Initialize TFRecord shard writer.
-        
+
         Args:
             output_dir: Output directory for TFRecord files.
             episodes_per_shard: Number of episodes per shard file.
             split: Dataset split name.
+            spec: When given, step packing is specialized to this spec's
+                schema at construction (no per-step type dispatch).
         """
         if not HAS_TF:
             raise ImportError("TensorFlow required for TFRecord export")
-        
+
         self.output_dir = Path(output_dir)
         self.episodes_per_shard = episodes_per_shard
         self.split = split
+        self._step_to_features = (
+            _compile_step_packer(spec) if spec is not None else step_to_features
+        )
         
         self._shard_idx = 0
         self._episode_count = 0
         self._current_writer: tf.io.TFRecordWriter | None = None
         self._shard_episode_count = 0
-    
+        # Single IO worker keeps shard writes ordered while overlapping
+        # them with protobuf serialization on the caller thread
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_writes: list[Future[None]] = []
+
+    def _drain_pending_writes(self) -> None:
+        """Wait for queued shard writes, re-raising any IO error."""
+        for future in self._pending_writes:
+            future.result()
+        self._pending_writes = []
+
     def _get_shard_path(self) -> Path:
         """Get path for current shard."""
         shard_dir = self.output_dir / self.split
@@ -57,8 +81,9 @@ class TFRecordShardWriter:
     def _start_new_shard(self) -> None:
         """Start a new shard file."""
         if self._current_writer is not None:
+            self._drain_pending_writes()
             self._current_writer.close()
-        
+
         self._current_writer = tf.io.TFRecordWriter(str(self._get_shard_path()))
         self._shard_episode_count = 0
     
@@ -78,82 +103,58 @@ class TFRecordShardWriter:
                 self._shard_idx += 1
             self._start_new_shard()
         
-        # Serialize episode
-        example = self._episode_to_example(episode)
-        self._current_writer.write(example.SerializeToString())
-        
+        # Serialize on the caller thread, write on the IO worker
+        example = self._episode_to_sequence_example(episode)
+        serialized = example.SerializeToString()
+        self._pending_writes.append(
+            self._io_executor.submit(self._current_writer.write, serialized)
+        )
+        # Bound the number of serialized episodes held in flight
+        if len(self._pending_writes) >= 16:
+            self._drain_pending_writes()
+
         self._shard_episode_count += 1
         self._episode_count += 1
-    
-    def _episode_to_example(self, episode: Episode) -> "tf.train.Example":
-        """Convert episode to TF Example."""
+
+    def _episode_to_sequence_example(self, episode: Episode) -> "tf.train.SequenceExample":
+        """Convert episode to TF SequenceExample.
+
+        The SequenceExample is written directly; wrapping its serialized
+        bytes in an outer Example would double the protobuf work and copy
+        the whole payload once more for no structural gain.
+        """
         # Build steps as sequence
         steps_features = []
         for step in episode.steps:
             step_features = self._step_to_features(step)
             steps_features.append(step_features)
-        
+
         # Create SequenceExample for variable-length steps
         context = tf.train.Features(feature={
             "episode_id": _bytes_feature(episode.episode_id.encode()),
             "num_steps": _int64_feature(len(episode.steps)),
         })
-        
+
         # Flatten steps into feature lists
         feature_lists = {}
         if steps_features:
             for key in steps_features[0]:
                 values = [sf[key] for sf in steps_features]
                 feature_lists[key] = tf.train.FeatureList(feature=values)
-        
-        sequence_example = tf.train.SequenceExample(
+
+        return tf.train.SequenceExample(
             context=context,
             feature_lists=tf.train.FeatureLists(feature_list=feature_lists),
         )
-        
-        # Convert to Example (simpler format)
-        return tf.train.Example(features=tf.train.Features(feature={
-            "episode_id": _bytes_feature(episode.episode_id.encode()),
-            "serialized_steps": _bytes_feature(sequence_example.SerializeToString()),
-        }))
-    
-    def _step_to_features(self, step: "Step") -> dict[str, "tf.train.Feature"]:
-        """Convert step to feature dict."""
-        from embodied_datakit.schema.step import Step
-        
-        features = {
-            "is_first": _int64_feature(int(step.is_first)),
-            "is_last": _int64_feature(int(step.is_last)),
-            "is_terminal": _int64_feature(int(step.is_terminal)),
-            "reward": _float_feature(step.reward or 0.0),
-            "discount": _float_feature(step.discount or 1.0),
-        }
-        
-        # Add action
-        if step.action is not None:
-            features["action"] = _float_list_feature(step.action.flatten().tolist())
-        
-        # Add observations
-        for key, value in step.observation.items():
-            safe_key = key.replace(".", "_")
-            if isinstance(value, np.ndarray):
-                if value.dtype == np.uint8:
-                    features[f"obs_{safe_key}"] = _bytes_feature(value.tobytes())
-                else:
-                    features[f"obs_{safe_key}"] = _float_list_feature(value.flatten().tolist())
-            elif isinstance(value, (str, bytes)):
-                if isinstance(value, str):
-                    value = value.encode()
-                features[f"obs_{safe_key}"] = _bytes_feature(value)
-        
-        return features
     
     def finish(self) -> dict[str, Any]:
         """Finish writing and return metadata."""
         if self._current_writer is not None:
+            self._drain_pending_writes()
             self._current_writer.close()
             self._current_writer = None
-        
+        self._io_executor.shutdown(wait=True)
+
         return {
             "num_episodes": self._episode_count,
             "num_shards": self._shard_idx + 1,
@@ -184,28 +185,174 @@ class TFRecordShardWriter:
             },
         }
         
+        # Buffered tmp-file write + os.replace keeps the metadata atomic
         info_path = self.output_dir / "dataset_info.json"
-        with open(info_path, "w") as f:
+        tmp_path = info_path.with_suffix(".tmp")
+        with open(tmp_path, "w", buffering=1 << 20) as f:
             json.dump(info, f, indent=2)
-        
+        os.replace(tmp_path, info_path)
+
         return info_path
 
 
+# Cache of dotted -> underscore observation column names, shared across steps
+_SAFE_KEY_CACHE: dict[str, str] = {}
+
+
+def _ndarray_bytes(arr: np.ndarray) -> bytes:
+    """Get the raw bytes of an array with a single copy.
+
+    For C-contiguous arrays this hands the buffer straight to bytes()
+    via the buffer protocol; tobytes() handles the non-contiguous case
+    (one internal gather pass). A compiled _fast_step extension can do
+    the PyBytes_FromStringAndSize handoff without the Python-level call.
+    """
+    if arr.flags.c_contiguous:
+        return bytes(arr.data)
+    return arr.tobytes()
+
+
+def _safe_obs_key(key: str) -> str:
+    """Get the TFRecord feature name for an observation key."""
+    safe_key = _SAFE_KEY_CACHE.get(key)
+    if safe_key is None:
+        safe_key = f"obs_{key.replace('.', '_')}"
+        _SAFE_KEY_CACHE[key] = safe_key
+    return safe_key
+
+
+def _float_array_feature(arr: np.ndarray) -> "tf.train.Feature":
+    """Pack a float array as a feature.
+
+    Long vectors go through as one raw little-endian float32 buffer
+    (tf.io.decode_raw on read, see RAW_FLOAT_MIN_ELEMENTS in the schema
+    module); short ones keep the per-element FloatList encoding.
+    """
+    arr = np.ascontiguousarray(arr, dtype=np.float32)
+    if arr.size >= RAW_FLOAT_MIN_ELEMENTS:
+        return _bytes_feature(_ndarray_bytes(arr))
+    return _float_list_feature(arr.ravel().tolist())
+
+
+def step_to_features(step: "Step") -> dict[str, "tf.train.Feature"]:
+    """Convert a step to its TFRecord feature dict.
+
+    Module-level so a compiled extension can override it (see the
+    optional import below); the pure-Python path is the fallback.
+    """
+    features = {
+        "is_first": _int64_feature(int(step.is_first)),
+        "is_last": _int64_feature(int(step.is_last)),
+        "is_terminal": _int64_feature(int(step.is_terminal)),
+        "reward": _float_feature(step.reward or 0.0),
+        "discount": _float_feature(step.discount or 1.0),
+    }
+
+    # Add action
+    if step.action is not None:
+        features["action"] = _float_array_feature(step.action)
+
+    # Add observations
+    for key, value in step.observation.items():
+        if isinstance(value, np.ndarray):
+            if value.dtype == np.uint8:
+                features[_safe_obs_key(key)] = _bytes_feature(_ndarray_bytes(value))
+            else:
+                features[_safe_obs_key(key)] = _float_array_feature(value)
+        elif isinstance(value, (str, bytes)):
+            if isinstance(value, str):
+                value = value.encode()
+            features[_safe_obs_key(key)] = _bytes_feature(value)
+
+    return features
+
+
+# The helpers below append into a fresh Feature's lazily-created list
+# rather than building a separate Int64List/FloatList/BytesList message
+# and copying it into the Feature constructor — one message allocation
+# per feature instead of two.
+
 def _bytes_feature(value: bytes) -> "tf.train.Feature":
     """Create bytes feature."""
-    return tf.train.Feature(bytes_list=tf.train.BytesList(value=[value]))
+    feature = tf.train.Feature()
+    feature.bytes_list.value.append(value)
+    return feature
 
 
 def _int64_feature(value: int) -> "tf.train.Feature":
     """Create int64 feature."""
-    return tf.train.Feature(int64_list=tf.train.Int64List(value=[value]))
+    feature = tf.train.Feature()
+    feature.int64_list.value.append(value)
+    return feature
 
 
 def _float_feature(value: float) -> "tf.train.Feature":
     """Create float feature."""
-    return tf.train.Feature(float_list=tf.train.FloatList(value=[value]))
+    feature = tf.train.Feature()
+    feature.float_list.value.append(value)
+    return feature
 
 
 def _float_list_feature(values: list[float]) -> "tf.train.Feature":
     """Create float list feature."""
-    return tf.train.Feature(float_list=tf.train.FloatList(value=values))
+    feature = tf.train.Feature()
+    feature.float_list.value.extend(values)
+    return feature
+
+
+def _compile_step_packer(spec: DatasetSpec) -> Callable[["Step"], dict[str, "tf.train.Feature"]]:
+    """Generate a step packer specialized to one spec's schema.
+
+    The observation schema is fixed per dataset, so the isinstance/dtype
+    dispatch step_to_features repeats for every step can be decided once
+    here: each field's handler is chosen from the spec and emitted as a
+    straight-line assignment. Keys absent from a step are skipped, and
+    keys outside the schema are ignored — matching the generic path for
+    schema-conformant data.
+    """
+    lines = [
+        "def _packed_step_to_features(step):",
+        "    obs = step.observation",
+        "    features = {",
+        '        "is_first": _int64_feature(int(step.is_first)),',
+        '        "is_last": _int64_feature(int(step.is_last)),',
+        '        "is_terminal": _int64_feature(int(step.is_terminal)),',
+        '        "reward": _float_feature(step.reward or 0.0),',
+        '        "discount": _float_feature(step.discount or 1.0),',
+        "    }",
+        "    if step.action is not None:",
+        '        features["action"] = _float_array_feature(step.action)',
+    ]
+    for key, feat_spec in spec.observation_schema.items():
+        safe_key = _safe_obs_key(key)
+        lines.append(f"    value = obs.get({key!r})")
+        lines.append("    if value is not None:")
+        if feat_spec.dtype == "uint8":
+            handler = "_bytes_feature(_ndarray_bytes(value))"
+        elif feat_spec.dtype == "string":
+            handler = "_bytes_feature(value.encode() if isinstance(value, str) else value)"
+        else:
+            handler = "_float_array_feature(value)"
+        lines.append(f"        features[{safe_key!r}] = {handler}")
+    lines.append("    return features")
+
+    namespace: dict[str, Any] = {
+        "_int64_feature": _int64_feature,
+        "_float_feature": _float_feature,
+        "_bytes_feature": _bytes_feature,
+        "_float_array_feature": _float_array_feature,
+        "_ndarray_bytes": _ndarray_bytes,
+        "isinstance": isinstance,
+    }
+    exec("\n".join(lines), namespace)  # noqa: S102 - source built from spec literals only
+    return namespace["_packed_step_to_features"]
+
+
+# Optional compiled fast path (Cython extension); the pure-Python
+# step_to_features above is the fallback when it is not built.
+try:
+    from embodied_datakit.writers.rlds_tfds._fast_step import (  # noqa: F401,F811
+        step_to_features,  # type: ignore[no-redef]
+    )
+except ImportError:
+    pass
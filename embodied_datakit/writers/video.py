@@ -2,15 +2,31 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
 import json
+import queue
 import subprocess
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 
 import numpy as np
 
 
+def _stack_frames_u8(frames: list[np.ndarray]) -> np.ndarray:
+    """Stack same-shape uint8 frames into one contiguous (N, H, W, 3) batch.
+
+    Preallocates the batch and copies each frame exactly once, instead of
+    the two passes np.stack + ascontiguousarray would make.
+    """
+    batch = np.empty((len(frames), *frames[0].shape), dtype=np.uint8)
+    for i, frame in enumerate(frames):
+        batch[i] = frame
+    return batch
+
+
 @dataclass
 class VideoOffset:
     """Offset information for an episode in a video file."""
@@ -35,27 +51,84 @@ class VideoEncoder:
         output_path: Path to output MP4 file.
         fps: Frames per second.
         crf: Constant rate factor (quality, lower = better).
-        preset: Encoding preset (ultrafast to veryslow).
+        preset: libx264 encoding preset (ultrafast to veryslow).
         pix_fmt: Pixel format.
+        use_nvenc: Use h264_nvenc when available (None = auto-detect).
     """
-    
+
     output_path: Path
     fps: float = 10.0
     crf: int = 23
-    preset: str = "medium"
+    preset: str = "ultrafast"
     pix_fmt: str = "yuv420p"
+    use_nvenc: bool | None = None
     _process: subprocess.Popen | None = field(default=None, repr=False)
+    _queue: "queue.Queue[bytes | memoryview | None]" | None = field(default=None, repr=False)
+    _writer_thread: threading.Thread | None = field(default=None, repr=False)
+    _writer_error: BaseException | None = field(default=None, repr=False)
     _frame_count: int = 0
     _width: int = 0
     _height: int = 0
-    
+
+    # Cached NVENC probe result, shared across all encoder instances
+    _nvenc_available: ClassVar[bool | None] = None
+
+    @classmethod
+    def _detect_nvenc(cls) -> bool:
+        """Check once whether h264_nvenc can actually encode.
+
+        The -encoders listing only reflects compile-time support; stock
+        distro builds list h264_nvenc on machines with no NVIDIA driver,
+        where encoder init then fails. Probe with a one-frame test
+        encode so the cache records whether NVENC really works here.
+        """
+        if cls._nvenc_available is None:
+            try:
+                result = subprocess.run(
+                    [
+                        "ffmpeg", "-hide_banner",
+                        "-f", "lavfi",
+                        "-i", "color=size=64x64:duration=0.04",
+                        "-frames:v", "1",
+                        "-c:v", "h264_nvenc",
+                        "-f", "null", "-",
+                    ],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=10,
+                )
+                cls._nvenc_available = result.returncode == 0
+            except (OSError, subprocess.SubprocessError):
+                cls._nvenc_available = False
+        return cls._nvenc_available
+
     def __post_init__(self) -> None:
         self.output_path = Path(self.output_path)
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
-    
+
+    def _codec_args(self) -> list[str]:
+        """Get encoder selection args (NVENC when present, else libx264)."""
+        use_nvenc = self.use_nvenc if self.use_nvenc is not None else self._detect_nvenc()
+        if use_nvenc:
+            # Hardware encode: quality target via -cq, preset p4 ~ medium
+            return [
+                "-c:v", "h264_nvenc",
+                "-preset", "p4",
+                "-cq", str(self.crf),
+                "-rc", "vbr",
+            ]
+        return [
+            "-c:v", "libx264",
+            "-crf", str(self.crf),
+            "-preset", self.preset,
+            "-tune", "zerolatency",
+            "-threads", "0",
+            "-x264-params", "sliced-threads=1",
+        ]
+
     def start(self, width: int, height: int) -> None:
         """Start the encoder process.
-        
+
         Args:
             width: Frame width.
             height: Frame height.
@@ -63,7 +136,7 @@ class VideoEncoder:
         self._width = width
         self._height = height
         self._frame_count = 0
-        
+
         cmd = [
             "ffmpeg",
             "-y",  # Overwrite output
@@ -73,20 +146,74 @@ class VideoEncoder:
             "-pix_fmt", "rgb24",
             "-r", str(self.fps),
             "-i", "-",  # Read from stdin
-            "-c:v", "libx264",
-            "-crf", str(self.crf),
-            "-preset", self.preset,
+            *self._codec_args(),
             "-pix_fmt", self.pix_fmt,
             str(self.output_path),
         ]
-        
+        self._spawn(cmd)
+
+    def start_copy(self, input_pipe_fmt: str = "h264") -> None:
+        """Start a stream-copy remux process (no re-encode).
+
+        For inputs that already carry H.264 packets (e.g. re-sharding an
+        existing dataset), -c:v copy remuxes them into the MP4 container
+        with zero encode CPU. Feed packets via write_packet.
+
+        Args:
+            input_pipe_fmt: ffmpeg demuxer name for the incoming stream.
+        """
+        self._width = 0
+        self._height = 0
+        self._frame_count = 0
+
+        cmd = [
+            "ffmpeg",
+            "-y",  # Overwrite output
+            "-f", input_pipe_fmt,
+            "-r", str(self.fps),
+            "-i", "-",  # Read from stdin
+            "-c:v", "copy",
+            str(self.output_path),
+        ]
+        self._spawn(cmd)
+
+    def _spawn(self, cmd: list[str]) -> None:
+        """Launch ffmpeg and the stdin writer thread."""
         self._process = subprocess.Popen(
             cmd,
             stdin=subprocess.PIPE,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
-    
+
+        # Feed stdin from a worker thread so callers overlap frame
+        # preparation with encoder backpressure
+        self._writer_error = None
+        self._queue = queue.Queue(maxsize=4)
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+
+    def _writer_loop(self) -> None:
+        """Drain queued buffers into ffmpeg's stdin (worker thread)."""
+        assert self._queue is not None
+        while True:
+            buf = self._queue.get()
+            if buf is None:  # Sentinel from finish()
+                break
+            if self._writer_error is not None:
+                continue  # Keep draining so producers never block on a dead pipe
+            try:
+                self._process.stdin.write(buf)
+            except BaseException as exc:  # Surfaced to the caller on next write
+                self._writer_error = exc
+
+    def _enqueue(self, buf: bytes | memoryview) -> None:
+        """Queue a raw buffer for the writer thread, re-raising its errors."""
+        if self._writer_error is not None:
+            raise RuntimeError("Encoder writer thread failed") from self._writer_error
+        assert self._queue is not None
+        self._queue.put(buf)
+
     def write_frame(self, frame: np.ndarray) -> None:
         """Write a single frame.
         
@@ -102,15 +229,55 @@ class VideoEncoder:
         if frame.ndim == 2:
             frame = np.stack([frame] * 3, axis=-1)
         
-        self._process.stdin.write(frame.tobytes())
+        self._enqueue(frame.tobytes())
         self._frame_count += 1
-    
+
+    def write_frames(self, frames_arr: np.ndarray) -> None:
+        """Write a batch of frames in a single pipe write.
+
+        Args:
+            frames_arr: C-contiguous RGB frames as uint8 array (N, H, W, 3).
+        """
+        if self._process is None:
+            raise RuntimeError("Encoder not started")
+        if frames_arr.dtype != np.uint8 or frames_arr.ndim != 4:
+            raise ValueError("frames_arr must be a (N, H, W, 3) uint8 array")
+        if not frames_arr.flags.c_contiguous:
+            frames_arr = np.ascontiguousarray(frames_arr)
+
+        self._enqueue(frames_arr.data)
+        self._frame_count += len(frames_arr)
+
+    def write_packet(self, packet: bytes) -> None:
+        """Write one already-encoded packet (stream-copy mode).
+
+        Args:
+            packet: Encoded access unit (one frame) for the copy muxer.
+        """
+        if self._process is None:
+            raise RuntimeError("Encoder not started")
+        self._enqueue(packet)
+        self._frame_count += 1
+
     def finish(self) -> int:
         """Finish encoding and return frame count."""
         if self._process is not None:
-            self._process.stdin.close()
+            if self._queue is not None:
+                self._queue.put(None)  # Sentinel
+                self._writer_thread.join()
+                self._queue = None
+                self._writer_thread = None
+            # Closing stdin flushes the pipe and raises if ffmpeg already
+            # died; suppress that so the child is always reaped and the
+            # captured root cause below is what the caller sees
+            with contextlib.suppress(OSError):
+                self._process.stdin.close()
             self._process.wait()
             self._process = None
+            if self._writer_error is not None:
+                error = self._writer_error
+                self._writer_error = None
+                raise RuntimeError("Encoder writer thread failed") from error
         return self._frame_count
     
     @property
@@ -148,6 +315,7 @@ class VideoShardWriter:
         self._shard_idx = 0
         self._encoder: VideoEncoder | None = None
         self._shard_frame_count = 0
+        self._copy_mode = False
         self._episode_offsets: dict[str, VideoOffset] = {}
     
     def _get_shard_path(self) -> Path:
@@ -165,6 +333,21 @@ class VideoShardWriter:
             crf=self.crf,
         )
         self._encoder.start(width, height)
+        self._copy_mode = False
+        self._shard_frame_count = 0
+
+    def _start_new_copy_shard(self) -> None:
+        """Start a new stream-copy video shard."""
+        if self._encoder is not None:
+            self._encoder.finish()
+
+        self._encoder = VideoEncoder(
+            output_path=self._get_shard_path(),
+            fps=self.fps,
+            crf=self.crf,
+        )
+        self._encoder.start_copy()
+        self._copy_mode = True
         self._shard_frame_count = 0
     
     def write_episode_frames(
@@ -187,6 +370,7 @@ class VideoShardWriter:
         # Check if we need a new shard
         if (
             self._encoder is None
+            or self._copy_mode
             or self._shard_frame_count + len(frames) > self.max_frames_per_shard
         ):
             if self._encoder is not None:
@@ -198,11 +382,19 @@ class VideoShardWriter:
         start_frame = self._shard_frame_count
         video_file = str(self._get_shard_path().name)
         
-        # Write frames
-        for frame in frames:
-            self._encoder.write_frame(frame)
-            self._shard_frame_count += 1
-        
+        # Write frames: batch into one buffer when all shapes match,
+        # else fall back to the per-frame path
+        if all(
+            f.dtype == np.uint8 and f.ndim == 3 and f.shape == frames[0].shape
+            for f in frames
+        ):
+            self._encoder.write_frames(_stack_frames_u8(frames))
+            self._shard_frame_count += len(frames)
+        else:
+            for frame in frames:
+                self._encoder.write_frame(frame)
+                self._shard_frame_count += 1
+
         offset = VideoOffset(
             video_file=video_file,
             start_frame=start_frame,
@@ -211,6 +403,51 @@ class VideoShardWriter:
         self._episode_offsets[episode_id] = offset
         return offset
     
+    def write_episode_packets(
+        self, episode_id: str, packets: list[bytes]
+    ) -> VideoOffset:
+        """Write already-encoded H.264 packets for an episode.
+
+        Remuxes via the -c:v copy fast path, skipping the decode and
+        re-encode entirely. One packet is counted as one frame.
+
+        Args:
+            episode_id: Episode identifier.
+            packets: Encoded access units in presentation order.
+
+        Returns:
+            VideoOffset for this episode.
+        """
+        if not packets:
+            return VideoOffset(video_file="", start_frame=0, num_frames=0)
+
+        # Check if we need a new shard
+        if (
+            self._encoder is None
+            or not self._copy_mode
+            or self._shard_frame_count + len(packets) > self.max_frames_per_shard
+        ):
+            if self._encoder is not None:
+                self._encoder.finish()
+                self._shard_idx += 1
+            self._start_new_copy_shard()
+
+        # Record offset
+        start_frame = self._shard_frame_count
+        video_file = str(self._get_shard_path().name)
+
+        for packet in packets:
+            self._encoder.write_packet(packet)
+            self._shard_frame_count += 1
+
+        offset = VideoOffset(
+            video_file=video_file,
+            start_frame=start_frame,
+            num_frames=len(packets),
+        )
+        self._episode_offsets[episode_id] = offset
+        return offset
+
     def finish(self) -> dict[str, VideoOffset]:
         """Finish writing and return all offsets."""
         if self._encoder is not None:
@@ -223,3 +460,34 @@ class VideoShardWriter:
         return json.dumps({
             ep_id: off.to_dict() for ep_id, off in self._episode_offsets.items()
         })
+
+
+async def write_camera_episodes(
+    writers: dict[str, VideoShardWriter],
+    episode_id: str,
+    frames_by_camera: dict[str, list[np.ndarray]],
+) -> dict[str, VideoOffset]:
+    """Write one episode's frames for several cameras concurrently.
+
+    Each camera's shard writer runs on a worker thread via
+    asyncio.to_thread, so ffmpeg startup and pipe backpressure for the N
+    per-camera encoders overlap instead of serializing camera by camera.
+    Each VideoShardWriter must only ever appear under one camera here;
+    the writers themselves are not thread-safe.
+
+    Args:
+        writers: Shard writer per camera name.
+        episode_id: Episode identifier.
+        frames_by_camera: RGB frame lists keyed by camera name.
+
+    Returns:
+        VideoOffset per camera for this episode.
+    """
+    cameras = list(frames_by_camera)
+    offsets = await asyncio.gather(*(
+        asyncio.to_thread(
+            writers[camera].write_episode_frames, episode_id, frames_by_camera[camera]
+        )
+        for camera in cameras
+    ))
+    return dict(zip(cameras, offsets))
@@ -3,14 +3,26 @@ from __future__ import annotations
 
 import dataclasses
 import datetime as dt
+import functools
 import hashlib
 import json
 import os
+import shutil
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import yaml  # pyyaml
 
+try:  # libyaml-backed parser when pyyaml was built with it
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+try:  # Optional fast JSON serializer
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # ----------------------------
 # Minimal Beads JSONL schema
@@ -96,8 +108,12 @@ class IssueObj:
 # ID generation helpers
 # ----------------------------
 
+@functools.lru_cache(maxsize=None)
 def _sha6(s: str) -> str:
-    return hashlib.sha256(s.encode("utf-8")).hexdigest()[:6]
+    # BLAKE2s is faster than SHA-256 on short inputs and yields the
+    # 6-hex id natively with digest_size=3; memoized since the same
+    # (key, title) pairs recur across re-runs in one process.
+    return hashlib.blake2s(s.encode("utf-8"), digest_size=3).hexdigest()
 
 
 def gen_root_id(prefix: str, key: str, title: str) -> str:
@@ -124,7 +140,7 @@ class PlanError(RuntimeError):
 
 def load_plan(path: Path) -> Dict[str, Any]:
     with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def ensure_list(v: Any) -> List[Any]:
@@ -163,15 +179,26 @@ def build_issue_graph(plan: Dict[str, Any]) -> Tuple[List[IssueObj], Dict[str, s
 
     key_to_id: Dict[str, str] = {}
     issues_out: List[IssueObj] = []
+    deps_by_key: Dict[str, List[DepEdge]] = {}
+    # (from_key, to_key, dep_type) queued during traversal; resolved after,
+    # since explicit deps may reference keys not yet visited
+    pending_edges: List[Tuple[str, str, str]] = []
 
-    def emit_issue_node(node: Dict[str, Any], parent_key: Optional[str], sibling_index: int) -> str:
+    # Single iterative preorder DFS: emits issues and queues dep edges in
+    # one traversal. Children are pushed reversed so they pop in order.
+    roots = ensure_list(plan.get("issues"))
+    stack: List[Tuple[Dict[str, Any], Optional[str], int]] = [
+        (root, None, idx) for idx, root in reversed(list(enumerate(roots, start=1)))
+    ]
+    while stack:
+        node, parent_key, sibling_index = stack.pop()
         key = node["key"]
         title = node["title"]
         issue_type = node.get("issue_type", "")
         status = node.get("status", "")
         priority = int(node.get("priority", meta.get("default_priority", 2)))
 
-        # ID assignment
+        # ID assignment (parents are always visited before their children)
         if parent_key is None:
             issue_id = gen_root_id(prefix, key, title)
         else:
@@ -182,13 +209,19 @@ def build_issue_graph(plan: Dict[str, Any]) -> Tuple[List[IssueObj], Dict[str, s
             raise PlanError(f"Duplicate issue key: {key}")
         key_to_id[key] = issue_id
 
-        # Gather fields
-        desc = node.get("description", "") or ""
-        design = node.get("design", "") or ""
-        ac = node.get("acceptance_criteria", "") or ""
-        notes = node.get("notes", "") or ""
+        # Queue dep edges: implicit hierarchy edge first (child depends on
+        # parent) :contentReference[oaicite:20]{index=20}, then explicit deps
+        if parent_key is not None:
+            pending_edges.append((key, parent_key, "parent-child"))
+        for dep in ensure_list(node.get("deps")):
+            dep_type = dep["type"]
+            for on_key in ensure_list(dep.get("on")):
+                pending_edges.append((key, on_key, dep_type))
 
-        labels = normalize_labels(node, global_labels)
+        # The deps list is shared with the frozen IssueObj and filled in
+        # below, so no dataclasses.replace rebuild pass is needed
+        deps: List[DepEdge] = []
+        deps_by_key[key] = deps
 
         issues_out.append(
             IssueObj(
@@ -197,74 +230,35 @@ def build_issue_graph(plan: Dict[str, Any]) -> Tuple[List[IssueObj], Dict[str, s
                 priority=priority,
                 created_at=now,
                 updated_at=now,
-                description=desc,
-                design=design,
-                acceptance_criteria=ac,
-                notes=notes,
+                description=node.get("description", "") or "",
+                design=node.get("design", "") or "",
+                acceptance_criteria=node.get("acceptance_criteria", "") or "",
+                notes=node.get("notes", "") or "",
                 status=status,
                 issue_type=issue_type,
-                labels=labels,
-                dependencies=[],
+                labels=normalize_labels(node, global_labels),
+                dependencies=deps,
                 created_by=created_by,
             )
         )
 
-        # Recurse children
         children = ensure_list(node.get("children"))
-        for i, child in enumerate(children, start=1):
-            emit_issue_node(child, parent_key=key, sibling_index=i)
-
-        return issue_id
+        for i in range(len(children) - 1, -1, -1):
+            stack.append((children[i], key, i + 1))
 
-    # Emit all roots in order
-    roots = ensure_list(plan.get("issues"))
-    for idx, root in enumerate(roots, start=1):
-        # sibling_index unused for roots
-        emit_issue_node(root, parent_key=None, sibling_index=idx)
-
-    # Build dependency edges (including implicit parent-child edges)
-    issues_by_id = {iss.id: iss for iss in issues_out}
-    mutable_deps: Dict[str, List[DepEdge]] = {iss.id: [] for iss in issues_out}
-
-    def add_dep(from_key: str, to_key: str, dep_type: str) -> None:
-        from_id = key_to_id[from_key]
-        to_id = key_to_id[to_key]
-        mutable_deps[from_id].append(
+    # Resolve queued edges now that every key has an id
+    for from_key, to_key, dep_type in pending_edges:
+        deps_by_key[from_key].append(
             DepEdge(
-                issue_id=from_id,
-                depends_on_id=to_id,
+                issue_id=key_to_id[from_key],
+                depends_on_id=key_to_id[to_key],
                 dep_type=dep_type,
                 created_at=now,
                 created_by=created_by,
             )
         )
 
-    # explicit deps
-    def walk(node: Dict[str, Any], parent_key: Optional[str]) -> None:
-        key = node["key"]
-
-        # implicit hierarchy edge: child depends on parent (parent-child) :contentReference[oaicite:20]{index=20}
-        if parent_key is not None:
-            add_dep(key, parent_key, "parent-child")
-
-        for dep in ensure_list(node.get("deps")):
-            dep_type = dep["type"]
-            for on_key in ensure_list(dep.get("on")):
-                add_dep(key, on_key, dep_type)
-
-        for child in ensure_list(node.get("children")):
-            walk(child, parent_key=key)
-
-    for root in roots:
-        walk(root, parent_key=None)
-
-    # finalize issues with deps
-    finalized: List[IssueObj] = []
-    for iss in issues_out:
-        deps = mutable_deps.get(iss.id, [])
-        finalized.append(dataclasses.replace(iss, dependencies=deps))
-
-    return finalized, key_to_id
+    return issues_out, key_to_id
 
 
 def write_beads_files(issues: List[IssueObj], out_dir: Path) -> None:
@@ -272,17 +266,32 @@ def write_beads_files(issues: List[IssueObj], out_dir: Path) -> None:
     issues_jsonl = out_dir / "issues.jsonl"
     beads_jsonl = out_dir / "beads.jsonl"
 
-    # Write primary file
-    with issues_jsonl.open("w", encoding="utf-8") as f:
-        for iss in issues:
-            f.write(json.dumps(iss.to_json(), ensure_ascii=False))
-            f.write("\n")
+    # Serialize each issue once, then write in one bulk call
+    if orjson is not None:
+        payload = b"".join(orjson.dumps(iss.to_json()) + b"\n" for iss in issues)
+    else:
+        payload = "".join(
+            json.dumps(iss.to_json(), ensure_ascii=False) + "\n" for iss in issues
+        ).encode("utf-8")
+
+    _atomic_write_bytes(issues_jsonl, payload)
+
+    # Secondary filename for compatibility (some versions historically used beads.jsonl):
+    # byte-identical, so copy instead of re-serializing. :contentReference[oaicite:21]{index=21}
+    tmp = beads_jsonl.with_suffix(".tmp")
+    shutil.copyfile(issues_jsonl, tmp)
+    os.replace(tmp, beads_jsonl)
+
 
-    # Also write secondary filename for compatibility (some versions historically used beads.jsonl). :contentReference[oaicite:21]{index=21}
-    with beads_jsonl.open("w", encoding="utf-8") as f:
-        for iss in issues:
-            f.write(json.dumps(iss.to_json(), ensure_ascii=False))
-            f.write("\n")
+def _atomic_write_bytes(path: Path, payload: bytes) -> None:
+    # Large buffer keeps kernel round trips down on big plans; writing to
+    # a sibling .tmp then os.replace keeps readers from seeing torn files.
+    tmp = path.with_suffix(".tmp")
+    with open(tmp, "wb", buffering=1 << 20) as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 
 def write_default_beads_config(beads_dir: Path) -> None:
@@ -293,8 +302,9 @@ def write_default_beads_config(beads_dir: Path) -> None:
         "sync-branch": "beads-sync",
     }
     path = beads_dir / "config.yaml"
-    with path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(cfg, f, sort_keys=False)
+    _atomic_write_bytes(
+        path, yaml.safe_dump(cfg, sort_keys=False).encode("utf-8")
+    )
 
 
 def main() -> None:
@@ -7,6 +7,13 @@ from embodied_datakit.schema.episode import Episode
 from embodied_datakit.schema.spec import DatasetSpec, FeatureSpec
 from embodied_datakit.schema.step import Step
 
+# Fixture arrays are precomputed once at module scope and sliced per step;
+# regenerating ~2 MB images per fixture invocation dominated setup time.
+_RNG = np.random.default_rng(0)
+_IMAGE_BLOB = _RNG.integers(0, 255, (10, 256, 256, 3), dtype=np.uint8)
+_STATE_BLOB = _RNG.standard_normal((10, 7), dtype=np.float32)
+_ACTION_BLOB = _RNG.standard_normal((10, 7), dtype=np.float32)
+
 
 @pytest.fixture
 def sample_step() -> Step:
@@ -15,10 +22,10 @@ def sample_step() -> Step:
         is_first=True,
         is_last=False,
         observation={
-            "observation.images.front": np.random.randint(0, 255, (256, 256, 3), dtype=np.uint8),
-            "observation.state": np.random.randn(7).astype(np.float32),
+            "observation.images.front": _IMAGE_BLOB[0],
+            "observation.state": _STATE_BLOB[0],
         },
-        action=np.random.randn(7).astype(np.float32),
+        action=_ACTION_BLOB[0],
         reward=0.0,
         discount=1.0,
         timestamp=0.0,
@@ -35,10 +42,10 @@ def sample_episode() -> Episode:
         is_first=True,
         is_last=False,
         observation={
-            "observation.images.front": np.random.randint(0, 255, (256, 256, 3), dtype=np.uint8),
-            "observation.state": np.random.randn(7).astype(np.float32),
+            "observation.images.front": _IMAGE_BLOB[0],
+            "observation.state": _STATE_BLOB[0],
         },
-        action=np.random.randn(7).astype(np.float32),
+        action=_ACTION_BLOB[0],
         reward=0.0,
         discount=1.0,
         timestamp=0.0,
@@ -50,10 +57,10 @@ def sample_episode() -> Episode:
             is_first=False,
             is_last=False,
             observation={
-                "observation.images.front": np.random.randint(0, 255, (256, 256, 3), dtype=np.uint8),
-                "observation.state": np.random.randn(7).astype(np.float32),
+                "observation.images.front": _IMAGE_BLOB[i],
+                "observation.state": _STATE_BLOB[i],
             },
-            action=np.random.randn(7).astype(np.float32),
+            action=_ACTION_BLOB[i],
             reward=0.0,
             discount=1.0,
             timestamp=float(i) * 0.1,
@@ -65,8 +72,8 @@ def sample_episode() -> Episode:
         is_last=True,
         is_terminal=True,
         observation={
-            "observation.images.front": np.random.randint(0, 255, (256, 256, 3), dtype=np.uint8),
-            "observation.state": np.random.randn(7).astype(np.float32),
+            "observation.images.front": _IMAGE_BLOB[9],
+            "observation.state": _STATE_BLOB[9],
         },
         action=None,
         reward=1.0,
@@ -2,21 +2,40 @@
 
 from __future__ import annotations
 
+import functools
+import sys
+
 import numpy as np
 
 from embodied_datakit.schema.episode import Episode
 from embodied_datakit.schema.spec import DatasetSpec, FeatureSpec
 from embodied_datakit.schema.step import Step
 
+# Most tests only check image shape/dtype, so the default synthetic
+# resolution stays tiny; tests that exercise real resizing (which needs
+# a source larger than the (32, 32) target) use LARGE_IMAGE_SIZE.
+SMALL_IMAGE_SIZE = (8, 8, 3)
+LARGE_IMAGE_SIZE = (64, 64, 3)
+
+# Interned once: every step's observation dict reuses these exact key
+# objects, so downstream dict lookups hit the identity fast path
+_OBS_KEYS = (
+    sys.intern("observation.images.front"),
+    sys.intern("observation.state"),
+    sys.intern("observation.language"),
+)
+
 
 def generate_synthetic_episode(
     episode_idx: int = 0,
     num_steps: int = 10,
-    image_size: tuple[int, int, int] = (64, 64, 3),
+    image_size: tuple[int, int, int] = SMALL_IMAGE_SIZE,
     state_dim: int = 7,
     action_dim: int = 7,
     seed: int | None = None,
     task_text: str = "pick up the red block",
+    rng: np.random.Generator | None = None,
+    share_images: bool = False,
 ) -> Episode:
     """Generate a synthetic episode for testing.
 
@@ -26,33 +45,50 @@ def generate_synthetic_episode(
         image_size: Image observation shape (H, W, C).
         state_dim: State observation dimension.
         action_dim: Action dimension.
-        seed: Random seed for reproducibility.
+        seed: Random seed for reproducibility (ignored when rng is given).
         task_text: Task description.
+        rng: Generator to draw from, e.g. one spawned per episode from a
+            SeedSequence.
+        share_images: Reuse one (write-protected) image array for every
+            step — for tests that never inspect per-step pixels.
 
     Returns:
         Synthetic Episode with deterministic data.
     """
-    if seed is not None:
-        np.random.seed(seed + episode_idx)
-
-    steps = []
+    # Per-episode PCG64 generator: faster than the legacy MT19937 path
+    # and no global np.random state mutation (safe under pytest-xdist)
+    if rng is None:
+        rng = np.random.default_rng(None if seed is None else seed + episode_idx)
+
+    # Bulk RNG draws amortize per-call dispatch across the whole episode;
+    # the loop below only slices views
+    if share_images:
+        shared_image = rng.integers(0, 256, size=image_size, dtype=np.uint8)
+        shared_image.setflags(write=False)  # Catch accidental mutation
+        images = [shared_image] * num_steps
+    else:
+        images = rng.integers(0, 256, size=(num_steps, *image_size), dtype=np.uint8)
+    states = rng.standard_normal((num_steps, state_dim), dtype=np.float32)
+    actions = rng.standard_normal((max(num_steps - 1, 0), action_dim), dtype=np.float32)
+    actions *= np.float32(0.1)  # One in-place pass instead of a scale per step
+
+    # Preallocated and assigned by index; append would regrow the list
+    steps: list[Step] = [None] * num_steps  # type: ignore[list-item]
     for step_idx in range(num_steps):
         is_first = step_idx == 0
         is_last = step_idx == num_steps - 1
 
         # Generate observations
         observation = {
-            "observation.images.front": np.random.randint(
-                0, 256, size=image_size, dtype=np.uint8
-            ),
-            "observation.state": np.random.randn(state_dim).astype(np.float32),
-            "observation.language": task_text,
+            _OBS_KEYS[0]: images[step_idx],
+            _OBS_KEYS[1]: states[step_idx],
+            _OBS_KEYS[2]: task_text,
         }
 
         # Generate action (None for last step per RLDS convention)
         action = None
         if not is_last:
-            action = np.random.randn(action_dim).astype(np.float32) * 0.1
+            action = actions[step_idx]
 
         step = Step(
             is_first=is_first,
@@ -64,7 +100,7 @@ def generate_synthetic_episode(
             discount=0.0 if is_last else 0.99,
             timestamp=step_idx * 0.1,
         )
-        steps.append(step)
+        steps[step_idx] = step
 
     return Episode(
         episode_id=f"synthetic_{episode_idx:06d}",
@@ -75,12 +111,15 @@ def generate_synthetic_episode(
 
 
 def generate_synthetic_spec(
-    image_size: tuple[int, int, int] = (64, 64, 3),
+    image_size: tuple[int, int, int] = SMALL_IMAGE_SIZE,
     state_dim: int = 7,
     action_dim: int = 7,
 ) -> DatasetSpec:
     """Generate a DatasetSpec matching synthetic episodes.
 
+    Identical parameters return one shared instance (specs are built
+    identically across ~10 tests); callers must treat it as read-only.
+
     Args:
         image_size: Image observation shape.
         state_dim: State observation dimension.
@@ -89,6 +128,13 @@ def generate_synthetic_spec(
     Returns:
         DatasetSpec for synthetic data.
     """
+    return _cached_spec(tuple(image_size), state_dim, action_dim)
+
+
+@functools.lru_cache(maxsize=16)
+def _cached_spec(
+    image_size: tuple[int, int, int], state_dim: int, action_dim: int
+) -> DatasetSpec:
     return DatasetSpec(
         dataset_id="synthetic_test",
         dataset_name="Synthetic Test Dataset",
@@ -122,28 +168,60 @@ def generate_synthetic_spec(
     )
 
 
+def stack_actions(episode: Episode) -> np.ndarray:
+    """Stack an episode's non-None actions into one (N, action_dim) array.
+
+    Lets tests assert over all actions with a couple of vectorized calls
+    instead of a Python loop per step.
+    """
+    return np.stack([s.action for s in episode.steps if s.action is not None])
+
+
+@functools.lru_cache(maxsize=None)
+def _generate_synthetic_dataset_cached(
+    num_episodes: int, steps_per_episode: int, seed: int, share_images: bool
+) -> tuple[tuple[Episode, ...], DatasetSpec]:
+    """Memoized dataset generation; safe because transforms and writers
+    are copy-on-write and tests treat fixture episodes as read-only."""
+    spec = generate_synthetic_spec()
+    # SeedSequence.spawn gives statistically independent per-episode
+    # streams (a linear seed shift correlates them) and stays
+    # deterministic per episode index
+    child_seeds = np.random.SeedSequence(seed).spawn(num_episodes)
+    episodes = tuple(
+        generate_synthetic_episode(
+            episode_idx=i,
+            num_steps=steps_per_episode,
+            rng=np.random.default_rng(child_seeds[i]),
+            share_images=share_images,
+        )
+        for i in range(num_episodes)
+    )
+    return episodes, spec
+
+
 def generate_synthetic_dataset(
     num_episodes: int = 5,
     steps_per_episode: int = 10,
     seed: int = 42,
+    share_images: bool = False,
 ) -> tuple[list[Episode], DatasetSpec]:
     """Generate a complete synthetic dataset.
 
+    Repeated calls with the same parameters return the same cached
+    episodes (tests across the suite use identical triples).
+
     Args:
         num_episodes: Number of episodes to generate.
         steps_per_episode: Steps per episode.
         seed: Random seed for reproducibility.
+        share_images: Reuse one image array per episode for tests that
+            never inspect per-step pixels.
 
     Returns:
         Tuple of (episodes list, DatasetSpec).
     """
-    spec = generate_synthetic_spec()
-    episodes = [
-        generate_synthetic_episode(
-            episode_idx=i,
-            num_steps=steps_per_episode,
-            seed=seed,
-        )
-        for i in range(num_episodes)
-    ]
-    return episodes, spec
+    episodes, spec = _generate_synthetic_dataset_cached(
+        num_episodes, steps_per_episode, seed, share_images
+    )
+    return list(episodes), spec
@@ -0,0 +1,37 @@
+"""Shared fixtures for integration tests."""
+
+from pathlib import Path
+
+import pytest
+
+from tests.fixtures import generate_synthetic_dataset
+
+
+@pytest.fixture(scope="session")
+def compiled_lerobot_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Compile a synthetic dataset to LeRobot v3 once per session.
+
+    Tests assert on the written artifacts and must treat the directory
+    as read-only.
+    """
+    from embodied_datakit.writers import LeRobotV3Writer
+
+    output_dir = tmp_path_factory.mktemp("lerobot")
+    episodes, spec = generate_synthetic_dataset(num_episodes=3, steps_per_episode=5, share_images=True)
+
+    # Random float columns gain nothing from dictionary probing; ZSTD-1
+    # keeps compression CPU out of the test path
+    writer = LeRobotV3Writer(
+        parquet_kwargs={
+            "use_dictionary": False,
+            "compression": "zstd",
+            "compression_level": 1,
+            "row_group_size": 65536,
+        }
+    )
+    writer.begin(spec, output_dir)
+    for episode in episodes:
+        writer.write_episode(episode)
+    writer.finalize()
+
+    return output_dir
@@ -12,23 +12,49 @@ from embodied_datakit.transforms.action import (
     PadActionTransform,
 )
 from embodied_datakit.transforms.camera import ResizeImagesTransform, SelectCameraTransform
+from tests.fixtures import LARGE_IMAGE_SIZE, stack_actions
 
+# Immutable transform inputs shared across the action-transform tests;
+# the transforms return new arrays, so these are never written to
+_PAD_ACTION = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+_PAD_ACTION.setflags(write=False)
+_TRUNC_ACTION = np.arange(10, dtype=np.float32)
+_TRUNC_ACTION.setflags(write=False)
+_MAP_ACTION = np.arange(8, dtype=np.float32)  # 7 joints + gripper
+_MAP_ACTION.setflags(write=False)
 
-@pytest.fixture
+
+def _single_step_episode(action: np.ndarray) -> Episode:
+    """Build a one-step episode around a shared action array."""
+    steps = [Step(is_first=True, is_last=True, observation={}, action=action)]
+    return Episode(episode_id="test", dataset_id="test", steps=steps)
+
+
+@pytest.fixture(scope="module")
 def episode_with_cameras() -> Episode:
-    """Create episode with multiple cameras."""
-    steps = []
+    """Create episode with multiple cameras.
+
+    Module-scoped: transforms are copy-on-write, so tests share one
+    episode. Arrays are drawn in four bulk RNG calls and sliced per step.
+    """
+    rng = np.random.default_rng()
+    imgs_front = rng.integers(0, 255, (5, *LARGE_IMAGE_SIZE), dtype=np.uint8)
+    imgs_wrist = rng.integers(0, 255, (5, *LARGE_IMAGE_SIZE), dtype=np.uint8)
+    states = rng.standard_normal((5, 7), dtype=np.float32)
+    actions = rng.standard_normal((4, 7), dtype=np.float32)
+
+    steps: list[Step] = [None] * 5  # type: ignore[list-item]
     for i in range(5):
-        steps.append(Step(
+        steps[i] = Step(
             is_first=i == 0,
             is_last=i == 4,
             observation={
-                "observation.images.front": np.random.randint(0, 255, (64, 64, 3), dtype=np.uint8),
-                "observation.images.wrist": np.random.randint(0, 255, (64, 64, 3), dtype=np.uint8),
-                "observation.state": np.random.randn(7).astype(np.float32),
+                "observation.images.front": imgs_front[i],
+                "observation.images.wrist": imgs_wrist[i],
+                "observation.state": states[i],
             },
-            action=np.random.randn(7).astype(np.float32) if i < 4 else None,
-        ))
+            action=actions[i] if i < 4 else None,
+        )
     return Episode(
         episode_id="test_001",
         dataset_id="test",
@@ -43,8 +69,8 @@ def spec_with_cameras() -> DatasetSpec:
         dataset_id="test",
         dataset_name="Test",
         observation_schema={
-            "observation.images.front": FeatureSpec(dtype="uint8", shape=(64, 64, 3), is_video=True),
-            "observation.images.wrist": FeatureSpec(dtype="uint8", shape=(64, 64, 3), is_video=True),
+            "observation.images.front": FeatureSpec(dtype="uint8", shape=LARGE_IMAGE_SIZE, is_video=True),
+            "observation.images.wrist": FeatureSpec(dtype="uint8", shape=LARGE_IMAGE_SIZE, is_video=True),
         },
         camera_names=["front", "wrist"],
     )
@@ -99,11 +125,10 @@ class TestNormalizeActionsTransform:
         transform = NormalizeActionsTransform(action_bounds=(-1.0, 1.0))
         result = transform.transform_episode(episode_with_cameras, spec_with_cameras)
 
-        # Check actions are within [-1, 1]
-        for step in result.steps:
-            if step.action is not None:
-                assert np.all(step.action >= -1.0)
-                assert np.all(step.action <= 1.0)
+        # Check actions are within [-1, 1] (two vectorized checks total)
+        actions = stack_actions(result)
+        assert actions.min() >= -1.0
+        assert actions.max() <= 1.0
 
     def test_normalize_infers_bounds(
         self, episode_with_cameras: Episode, spec_with_cameras: DatasetSpec
@@ -121,15 +146,7 @@ class TestPadActionTransform:
 
     def test_pad_action(self) -> None:
         """Test padding action to target dimension."""
-        steps = [
-            Step(
-                is_first=True,
-                is_last=True,
-                observation={},
-                action=np.array([1.0, 2.0, 3.0], dtype=np.float32),
-            )
-        ]
-        episode = Episode(episode_id="test", dataset_id="test", steps=steps)
+        episode = _single_step_episode(_PAD_ACTION)
         spec = DatasetSpec(dataset_id="test", dataset_name="Test")
 
         transform = PadActionTransform(target_dim=7, pad_value=0.0)
@@ -142,15 +159,7 @@ class TestPadActionTransform:
 
     def test_truncate_action(self) -> None:
         """Test truncating action to target dimension."""
-        steps = [
-            Step(
-                is_first=True,
-                is_last=True,
-                observation={},
-                action=np.arange(10, dtype=np.float32),
-            )
-        ]
-        episode = Episode(episode_id="test", dataset_id="test", steps=steps)
+        episode = _single_step_episode(_TRUNC_ACTION)
         spec = DatasetSpec(dataset_id="test", dataset_name="Test")
 
         transform = PadActionTransform(target_dim=7)
@@ -165,15 +174,7 @@ class TestMapActionSpaceTransform:
 
     def test_map_joint_to_ee(self) -> None:
         """Test mapping joint space to end-effector space."""
-        steps = [
-            Step(
-                is_first=True,
-                is_last=True,
-                observation={},
-                action=np.arange(8, dtype=np.float32),  # 7 joints + gripper
-            )
-        ]
-        episode = Episode(episode_id="test", dataset_id="test", steps=steps)
+        episode = _single_step_episode(_MAP_ACTION)
         spec = DatasetSpec(dataset_id="test", dataset_name="Test")
 
         transform = MapActionSpaceTransform(
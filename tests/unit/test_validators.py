@@ -1,5 +1,7 @@
 """Unit tests for validators."""
 
+import sys
+
 import numpy as np
 import pytest
 
@@ -14,19 +16,92 @@ from embodied_datakit.validators.structural import (
     TimestampValidator,
 )
 
+# These tests share only read-only module state (frozen arrays,
+# stateless validator singletons, module-scoped fixtures), so pytest
+# -n auto can schedule them across workers freely
+pytestmark = [pytest.mark.unit]
+
+# Shared read-only step inputs; validators never write to them, and the
+# write=False flag catches any validator regression that tries
+_ZERO7_F32 = np.zeros(7, dtype=np.float32)
+_ZERO7_F32.setflags(write=False)
+# float32 matches the dtype production actions use (and the valid
+# fixture), and halves the bytes the NaN scan touches
+_NAN_ACTION = np.array([np.nan, 0.0, 0.0], dtype=np.float32)
+_NAN_ACTION.setflags(write=False)
+
+# Shared by every negative-case Step; must stay a real dict (Step checks
+# isinstance) and must never be written to
+_EMPTY_OBS: dict = {}
+
+# Interned message substrings for the negative-path assertions, created
+# once so the scans compare against a single stable string object
+_MSG_IS_FIRST = sys.intern("is_first")
+_MSG_IS_LAST = sys.intern("is_last")
+_MSG_NAN = sys.intern("NaN")
+
+# Timestamps for the 10-step valid episode, materialized once at import;
+# shorter variants can slice _VALID_TS[:n]
+_VALID_TS = (np.arange(10, dtype=np.float64) * 0.1).tolist()
+
+# Validators are stateless and pure, so one shared instance per config
+# serves every test (and is safe under parallel workers); cases needing
+# other configs (e.g. min_length=5) construct locally
+_VALIDATORS = {
+    "rlds": RLDSInvariantValidator(),
+    "ts": TimestampValidator(),
+    "action": ActionSanityValidator(),
+    "len_default": EpisodeLengthValidator(min_length=1, max_length=100),
+}
+
+
+def _episode(
+    actions: list,
+    timestamps: list | None = None,
+    *,
+    episode_id: str,
+    invalid: bool = False,
+) -> Episode:
+    """Build a small episode from parallel action/timestamp lists.
+
+    Flags are well-formed (is_first/is_last at the ends); tests probing
+    malformed flags still hand-roll their steps.
+    """
+    n = len(actions)
+    ts = timestamps if timestamps is not None else [0.0] * n
+    steps = [
+        Step(
+            is_first=i == 0,
+            is_last=i == n - 1,
+            observation=_EMPTY_OBS,
+            action=actions[i],
+            timestamp=ts[i],
+        )
+        for i in range(n)
+    ]
+    return Episode(
+        episode_id=episode_id, dataset_id="test", steps=steps, invalid=invalid
+    )
+
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def valid_episode() -> Episode:
-    """Create a valid episode that passes all validators."""
-    steps = []
-    for i in range(10):
-        steps.append(Step(
+    """Create a valid episode that passes all validators.
+
+    Module-scoped: validators only read episodes, so one instance
+    serves every test; derive a .copy() fixture if mutation is needed.
+    """
+    obs = {"observation.state": _ZERO7_F32}
+    steps = [
+        Step(
             is_first=i == 0,
             is_last=i == 9,
-            observation={"observation.state": np.zeros(7, dtype=np.float32)},
-            action=np.zeros(7, dtype=np.float32) if i < 9 else None,
-            timestamp=i * 0.1,
-        ))
+            observation=obs,
+            action=_ZERO7_F32 if i < 9 else None,
+            timestamp=_VALID_TS[i],
+        )
+        for i in range(10)
+    ]
     return Episode(
         episode_id="valid_001",
         dataset_id="test",
@@ -34,7 +109,7 @@ def valid_episode() -> Episode:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def spec() -> DatasetSpec:
     """Create a basic spec."""
     return DatasetSpec(
@@ -44,130 +119,99 @@ def spec() -> DatasetSpec:
     )
 
 
-class TestRLDSInvariantValidator:
-    """Tests for RLDS invariant validation."""
+@pytest.mark.parametrize(
+    "validator",
+    [
+        _VALIDATORS["rlds"],
+        _VALIDATORS["len_default"],
+        _VALIDATORS["ts"],
+        _VALIDATORS["action"],
+    ],
+    ids=["rlds", "length", "timestamp", "action"],
+)
+def test_valid_episode_passes(
+    validator, valid_episode: Episode, spec: DatasetSpec
+) -> None:
+    """Happy path for every validator: a valid episode has no errors."""
+    findings = validator.validate_episode(valid_episode, spec)
 
-    def test_valid_episode(self, valid_episode: Episode, spec: DatasetSpec) -> None:
-        """Test validation passes for valid episode."""
-        validator = RLDSInvariantValidator()
-        findings = validator.validate_episode(valid_episode, spec)
+    assert not any(f.severity is Severity.ERROR for f in findings)
 
-        errors = [f for f in findings if f.severity == Severity.ERROR]
-        assert len(errors) == 0
+
+class TestRLDSInvariantValidator:
+    """Tests for RLDS invariant validation."""
 
     def test_missing_is_first(self, spec: DatasetSpec) -> None:
         """Test detection of missing is_first."""
         steps = [
-            Step(is_first=False, is_last=False, observation={}, action=np.zeros(7)),
-            Step(is_first=False, is_last=True, observation={}, action=None),
+            Step(is_first=False, is_last=False, observation=_EMPTY_OBS, action=_ZERO7_F32),
+            Step(is_first=False, is_last=True, observation=_EMPTY_OBS, action=None),
         ]
         episode = Episode(episode_id="bad", dataset_id="test", steps=steps, invalid=True)
 
-        validator = RLDSInvariantValidator()
-        findings = validator.validate_episode(episode, spec)
+        findings = _VALIDATORS["rlds"].validate_episode(episode, spec)
 
-        errors = [f for f in findings if f.severity == Severity.ERROR]
-        assert len(errors) > 0
-        assert any("is_first" in f.message for f in errors)
+        assert any(
+            f.severity is Severity.ERROR and _MSG_IS_FIRST in f.message for f in findings
+        )
 
     def test_missing_is_last(self, spec: DatasetSpec) -> None:
         """Test detection of missing is_last."""
         steps = [
-            Step(is_first=True, is_last=False, observation={}, action=np.zeros(7)),
-            Step(is_first=False, is_last=False, observation={}, action=np.zeros(7)),
+            Step(is_first=True, is_last=False, observation=_EMPTY_OBS, action=_ZERO7_F32),
+            Step(is_first=False, is_last=False, observation=_EMPTY_OBS, action=_ZERO7_F32),
         ]
         episode = Episode(episode_id="bad", dataset_id="test", steps=steps, invalid=True)
 
-        validator = RLDSInvariantValidator()
-        findings = validator.validate_episode(episode, spec)
+        findings = _VALIDATORS["rlds"].validate_episode(episode, spec)
 
-        errors = [f for f in findings if f.severity == Severity.ERROR]
-        assert len(errors) > 0
-        assert any("is_last" in f.message for f in errors)
+        assert any(
+            f.severity is Severity.ERROR and _MSG_IS_LAST in f.message for f in findings
+        )
 
     def test_empty_episode(self, spec: DatasetSpec) -> None:
         """Test detection of empty episode."""
         episode = Episode(episode_id="empty", dataset_id="test", steps=[])
 
-        validator = RLDSInvariantValidator()
-        findings = validator.validate_episode(episode, spec)
-
-        errors = [f for f in findings if f.severity == Severity.ERROR]
-        assert len(errors) > 0
-
-
-class TestEpisodeLengthValidator:
-    """Tests for episode length validation."""
-
-    def test_valid_length(self, valid_episode: Episode, spec: DatasetSpec) -> None:
-        """Test validation passes for valid length."""
-        validator = EpisodeLengthValidator(min_length=1, max_length=100)
-        findings = validator.validate_episode(valid_episode, spec)
-
-        errors = [f for f in findings if f.severity == Severity.ERROR]
-        assert len(errors) == 0
-
-    def test_too_short(self, spec: DatasetSpec) -> None:
-        """Test detection of too-short episode."""
-        steps = [Step(is_first=True, is_last=True, observation={}, action=None)]
-        episode = Episode(episode_id="short", dataset_id="test", steps=steps)
-
-        validator = EpisodeLengthValidator(min_length=5)
-        findings = validator.validate_episode(episode, spec)
-
-        errors = [f for f in findings if f.severity == Severity.ERROR]
-        assert len(errors) > 0
-
-
-class TestTimestampValidator:
-    """Tests for timestamp validation."""
-
-    def test_valid_timestamps(self, valid_episode: Episode, spec: DatasetSpec) -> None:
-        """Test validation passes for valid timestamps."""
-        validator = TimestampValidator()
-        findings = validator.validate_episode(valid_episode, spec)
-
-        errors = [f for f in findings if f.severity == Severity.ERROR]
-        assert len(errors) == 0
-
-    def test_non_monotonic(self, spec: DatasetSpec) -> None:
-        """Test detection of non-monotonic timestamps."""
-        steps = [
-            Step(is_first=True, is_last=False, observation={}, action=np.zeros(7), timestamp=0.0),
-            Step(is_first=False, is_last=False, observation={}, action=np.zeros(7), timestamp=0.2),
-            Step(is_first=False, is_last=True, observation={}, action=None, timestamp=0.1),  # Out of order
-        ]
-        episode = Episode(episode_id="bad_ts", dataset_id="test", steps=steps)
-
-        validator = TimestampValidator()
-        findings = validator.validate_episode(episode, spec)
-
-        errors = [f for f in findings if f.severity == Severity.ERROR]
-        assert len(errors) > 0
-
-
-class TestActionSanityValidator:
-    """Tests for action sanity validation."""
-
-    def test_valid_actions(self, valid_episode: Episode, spec: DatasetSpec) -> None:
-        """Test validation passes for valid actions."""
-        validator = ActionSanityValidator()
-        findings = validator.validate_episode(valid_episode, spec)
-
-        errors = [f for f in findings if f.severity == Severity.ERROR]
-        assert len(errors) == 0
-
-    def test_nan_action(self, spec: DatasetSpec) -> None:
-        """Test detection of NaN in actions."""
-        steps = [
-            Step(is_first=True, is_last=False, observation={}, action=np.array([np.nan, 0, 0])),
-            Step(is_first=False, is_last=True, observation={}, action=None),
-        ]
-        episode = Episode(episode_id="nan_action", dataset_id="test", steps=steps)
-
-        validator = ActionSanityValidator()
-        findings = validator.validate_episode(episode, spec)
-
-        errors = [f for f in findings if f.severity == Severity.ERROR]
-        assert len(errors) > 0
-        assert any("NaN" in f.message for f in errors)
+        findings = _VALIDATORS["rlds"].validate_episode(episode, spec)
+
+        assert any(f.severity is Severity.ERROR for f in findings)
+
+
+@pytest.mark.parametrize(
+    ("build", "validator", "substring"),
+    [
+        pytest.param(
+            lambda: _episode([None], episode_id="short"),
+            EpisodeLengthValidator(min_length=5),
+            None,
+            id="too_short",
+        ),
+        pytest.param(
+            # Last timestamp out of order
+            lambda: _episode(
+                [_ZERO7_F32, _ZERO7_F32, None],
+                timestamps=[0.0, 0.2, 0.1],
+                episode_id="bad_ts",
+            ),
+            _VALIDATORS["ts"],
+            None,
+            id="non_monotonic",
+        ),
+        pytest.param(
+            lambda: _episode([_NAN_ACTION, None], episode_id="nan_action"),
+            _VALIDATORS["action"],
+            _MSG_NAN,
+            id="nan_action",
+        ),
+    ],
+)
+def test_negative_cases(build, validator, substring, spec: DatasetSpec) -> None:
+    """Each defect yields at least one ERROR, with the expected message."""
+    findings = validator.validate_episode(build(), spec)
+
+    assert any(
+        f.severity is Severity.ERROR
+        and (substring is None or substring in f.message)
+        for f in findings
+    )